@@ -1,37 +1,41 @@
 import logging
-from typing import List, Dict, Callable
+from typing import Iterable
 
 from telegram import Update
+from telegram.ext import CallbackContext, Filters
+from telegram.ext.filters import BaseFilter
 
 
 class AccessManager(object):
-    __valid_users = []
+    __valid_users = set()
 
     @classmethod
-    def add_users(cls, users: List) -> None:
+    def add_users(cls, users: Iterable) -> None:
         """
-        Adds new users to the list with valid users.
+        Adds new users to the set with valid users.
 
-        :param users: List with user ids.
+        :param users: User ids.
         """
-        cls.__valid_users.extend(users)
-
-    def __call__(self, func: Callable) -> Callable:
-        def wrapper(*args: List, **kwargs: Dict):
-            update = None
-            for arg in (args + tuple(kwargs.values())):
-                if isinstance(arg, Update):
-                    update = arg
-                    break
-            if update is None:
-                logging.critical('No argument has type "Update"!')
-            else:
-                user_id = update.effective_user.id
-                if user_id not in self.__valid_users:
-                    logging.warning('AccessManager: Access denied for {}'.format(user_id))
-                    update.message.reply_text('Access denied for you ({})!'.format(user_id))
-                    return
-                else:
-                    return func(*args, **kwargs)
-
-        return wrapper
+        cls.__valid_users.update(int(user) for user in users)
+
+    @classmethod
+    def create_filter(cls) -> BaseFilter:
+        """
+        Creates a filter which only lets updates of valid users pass.
+        Users have to be added before the filter is created.
+
+        :return: Filter for valid users.
+        """
+        return Filters.user(user_id=cls.__valid_users)
+
+    @staticmethod
+    def deny(update: Update, _: CallbackContext) -> None:
+        """
+        Informs an invalid user that the access is denied.
+
+        :param update: Bot update.
+        :param _: Unused parameter.
+        """
+        user_id = update.effective_user.id
+        logging.warning('AccessManager: Access denied for %s', user_id)
+        update.message.reply_text(f'Access denied for you ({user_id})!')
@@ -1,8 +1,12 @@
-import json
-from typing import Type, Dict, List
+from typing import Type, Dict, List, Optional
 
 from xvc_util import Point, Rectangle, Door, Room, Area
 
+try:
+    import ujson as json
+except ImportError:
+    import json
+
 
 class Configuration(object):
     """
@@ -44,7 +48,8 @@ class ConfigurationParser(object):
         """
         Reloads the configuration file.
         """
-        self.__root = json.load(open(self.__path))
+        with open(self.__path) as config_file:
+            self.__root = json.load(config_file)
 
     def parse_telegram_bot(self) -> Configuration.TelegramBotSettings:
         """
@@ -84,15 +89,18 @@ class ConfigurationParser(object):
 
         return Point(x, y)
 
-    def __parse_rectangle(self, type_name: str, _type: Type[Rectangle]) -> Dict[str, Rectangle]:
+    def __parse_rectangle(self, type_name: str, _type: Type[Rectangle],
+                          offset: Optional[Point] = None) -> Dict[str, Rectangle]:
         """
         Parses a rectangle type from the configuration.
 
         :param type_name: Name of the rectangle type.
         :param _type: Rectangle type.
+        :param offset: Already parsed offset, default is None to parse it.
         :return: Dictionary with the rectangles.
         """
-        offset = self.parse_offset()
+        if offset is None:
+            offset = self.parse_offset()
 
         result = dict()
         elements = self.__root['xiaomi_vacuum_cleaner']['zone_cleaning'][type_name]
@@ -139,9 +147,10 @@ class ConfigurationParser(object):
 
         :return: Dictionary with name of zone and list of cleaning areas.
         """
-        doors = self.parse_doors()
-        rooms = self.parse_rooms()
-        areas = self.parse_areas()
+        offset = self.parse_offset()
+        doors = self.__parse_rectangle('doors', Door, offset)
+        rooms = self.__parse_rectangle('rooms', Room, offset)
+        areas = self.__parse_rectangle('areas', Area, offset)
 
         zones = dict()
         config_zones = self.__root['xiaomi_vacuum_cleaner']['zone_cleaning']['zones']
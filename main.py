@@ -1,6 +1,8 @@
 import logging
+from typing import Callable, Dict
 
-from telegram.ext import ConversationHandler, Updater, CommandHandler, MessageHandler, Filters
+from telegram import Update
+from telegram.ext import CallbackContext, ConversationHandler, Updater, CommandHandler, MessageHandler, Filters
 
 from access_manager import AccessManager
 from json_parser import ConfigurationParser
@@ -10,6 +12,10 @@ from xvc_helper import XVCHelper, XVCHelperSimulator
 # constants
 LOG_FILE = 'bot.log'
 LOG_DISABLE = 100
+POLL_INTERVAL = 0.5
+POLL_TIMEOUT = 25
+POLL_READ_LATENCY = 2.0
+WORKERS = 8
 
 # logging
 logging.getLogger('telegram').setLevel(LOG_DISABLE)
@@ -26,6 +32,20 @@ logging.basicConfig(level=logging.NOTSET,
                     )
 
 
+def create_router(routes: Dict[str, Callable], default: Callable) -> Callable:
+    """
+    Creates a callback which dispatches a message by its text.
+
+    :param routes: Dictionary with message text and callback.
+    :param default: Callback for unknown message texts.
+    :return: Router callback.
+    """
+    def router(update: Update, context: CallbackContext) -> int:
+        return routes.get(update.message.text, default)(update, context)
+
+    return router
+
+
 # main program
 def main():
     # configuration
@@ -48,32 +68,47 @@ def main():
 
     zones = parser.parse_zones()
 
+    # the parsed configuration is not needed while the bot is running
+    del parser
+
     xvc_bot = XVCBot(vacuum, zones)
 
-    updater = Updater(token=config_bot.token, use_context=True)
+    updater = Updater(token=config_bot.token, workers=WORKERS, use_context=True)
     dispatcher = updater.dispatcher
 
+    # updates of invalid users are dropped before they reach the conversation
+    user_filter = AccessManager.create_filter()
+    # commands are left to the entry points and fallbacks
+    text_filter = user_filter & Filters.text & ~Filters.command
     conversation_handler = ConversationHandler(
-        entry_points=[CommandHandler('start', xvc_bot.start)],
+        entry_points=[CommandHandler('start', xvc_bot.start, filters=user_filter)],
         states={
-            MAIN_MENU: [MessageHandler(Filters.regex('^({})$'.format('Status')),
-                                       xvc_bot.status),
-                        MessageHandler(Filters.regex('^({})$'.format('Home')),
-                                       xvc_bot.home),
-                        MessageHandler(Filters.regex('^({})$'.format('ZoneCleaning')),
-                                       xvc_bot.select_fan)],
-            SELECT_FAN: [MessageHandler(Filters.regex('^({})$'.format('|'.join(FAN_BUTTONS + SKIP_BUTTON))),
-                                        xvc_bot.select_zone)],
-            SELECT_ZONE: [MessageHandler(Filters.regex('^({})$'.format('|'.join([zone.title() for zone in zones.keys()]))),
-                                         xvc_bot.cleaning)]
+            MAIN_MENU: [MessageHandler(text_filter,
+                                       create_router({'Status': xvc_bot.status,
+                                                      'Home': xvc_bot.home,
+                                                      'ZoneCleaning': xvc_bot.select_fan},
+                                                     xvc_bot.cancel),
+                                       run_async=True)],
+            SELECT_FAN: [MessageHandler(text_filter,
+                                        create_router(dict.fromkeys(FAN_BUTTONS + SKIP_BUTTON, xvc_bot.select_zone),
+                                                      xvc_bot.cancel),
+                                        run_async=True)],
+            SELECT_ZONE: [MessageHandler(text_filter,
+                                         create_router(dict.fromkeys(xvc_bot.zone_titles, xvc_bot.cleaning),
+                                                       xvc_bot.cancel),
+                                         run_async=True)]
         },
-        fallbacks=[CommandHandler('cancel', xvc_bot.cancel)]
+        fallbacks=[CommandHandler('cancel', xvc_bot.cancel, filters=user_filter)]
     )
 
     dispatcher.add_handler(conversation_handler)
+    dispatcher.add_handler(CommandHandler('start', AccessManager.deny, filters=~user_filter))
 
     logging.info('start bot')
-    updater.start_polling()
+    updater.start_polling(poll_interval=POLL_INTERVAL,
+                          timeout=POLL_TIMEOUT,
+                          read_latency=POLL_READ_LATENCY,
+                          allowed_updates=['message'])
     updater.idle()
 
 
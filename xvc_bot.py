@@ -1,43 +1,48 @@
 import logging
-from threading import Thread
-from typing import Dict, List
+from itertools import zip_longest
+from threading import Thread, Lock
+from typing import Dict, List, Tuple
 
 from telegram import Update, ReplyKeyboardMarkup, ReplyKeyboardRemove
 from telegram.ext import ConversationHandler, CallbackContext
 
-from access_manager import AccessManager
 from xvc_helper import XVCHelperBase, XVCHelperSimulator
 from xvc_util import Rectangle
 
 # constants
-SKIP_BUTTON = ['Skip']
-MAIN_BUTTONS = ['Status', 'Home', 'ZoneCleaning']
-FAN_BUTTONS = [value.name for value in XVCHelperBase.FanLevel]
+SKIP_BUTTON = ('Skip',)
+MAIN_BUTTONS = ('Status', 'Home', 'ZoneCleaning')
+FAN_BUTTONS = tuple(XVCHelperBase.FAN_LEVELS.keys())
 
 MAIN_MENU, SELECT_FAN, SELECT_ZONE = range(3)
 
+REMOVE_BUTTONS = ReplyKeyboardRemove().to_json()
+
 
 class StatusThread(Thread):
     """
     Simple thread to get actual status from the vacuum cleaner.
     """
 
-    def __init__(self, vacuum: XVCHelperBase) -> None:
+    def __init__(self, vacuum: XVCHelperBase, vacuum_lock: Lock) -> None:
         """
         Initializes the thread to get actual status.
 
         :param vacuum: Reference to vacuum cleaner.
+        :param vacuum_lock: Lock guarding the vacuum cleaner.
         """
         super().__init__()
         self.daemon = True
         self.__vacuum = vacuum
+        self.__vacuum_lock = vacuum_lock
         self.success = False
 
     def run(self) -> None:
         """
         Starts the thread.
         """
-        self.success, _ = self.__vacuum.status()
+        with self.__vacuum_lock:
+            self.success, _ = self.__vacuum.status()
 
 
 class XVCBot(object):
@@ -45,6 +50,9 @@ class XVCBot(object):
     Xiaomi Vacuum Cleaner Bot.
     """
 
+    __slots__ = ('__vacuum', '__zones', '__zone_titles', '__main_buttons', '__fan_buttons', '__zone_buttons',
+                 '__status_thread', '__vacuum_lock')
+
     def __init__(self, vacuum: XVCHelperBase, zones: Dict[str, List[Rectangle]]):
         """
         Initializes the Xiaomi Vacuum Cleaner Bot.
@@ -54,20 +62,33 @@ class XVCBot(object):
         :param zones: Dictionary with all cleaning zones.
         """
         self.__vacuum = vacuum
-        self.__zones = zones
+        # the vacuum cleaner is shared by all chats and miio devices are not thread-safe
+        self.__vacuum_lock = Lock()
+        self.__zones = {zone.title(): rectangles for zone, rectangles in zones.items()}
+        self.__zone_titles = sorted(self.__zones.keys())
+        # keyboards are static, so they are serialized only once
         self.__main_buttons = ReplyKeyboardMarkup(
             XVCBot.build_menu(MAIN_BUTTONS),
-            one_time_keyboard=True)
+            one_time_keyboard=True).to_json()
         self.__fan_buttons = ReplyKeyboardMarkup(
             XVCBot.build_menu(FAN_BUTTONS, header_buttons=SKIP_BUTTON),
-            one_time_keyboard=True)
+            one_time_keyboard=True).to_json()
         self.__zone_buttons = ReplyKeyboardMarkup(
-            XVCBot.build_menu(sorted([zone.title() for zone in self.__zones.keys()])),
-            one_time_keyboard=True)
+            XVCBot.build_menu(self.__zone_titles),
+            one_time_keyboard=True).to_json()
         self.__status_thread = None
 
+    @property
+    def zone_titles(self) -> List[str]:
+        """
+        Gets the sorted titles of all cleaning zones.
+
+        :return: List with zone titles.
+        """
+        return self.__zone_titles
+
     @staticmethod
-    def build_menu(buttons, columns=2, header_buttons=None, footer_buttons=None) -> List:
+    def build_menu(buttons, columns=2, header_buttons=None, footer_buttons=None) -> Tuple:
         """
         Creates a telegram menu with buttons.
 
@@ -75,13 +96,14 @@ class XVCBot(object):
         :param columns: Number of columns
         :param header_buttons: Special header buttons.
         :param footer_buttons: Special footer buttons.
-        :return: List of buttons.
+        :return: Rows of buttons.
         """
-        menu = [buttons[i:i + columns] for i in range(0, len(buttons), columns)]
+        rows = zip_longest(*[iter(buttons)] * columns)
+        menu = tuple(tuple(button for button in row if button is not None) for row in rows)
         if header_buttons:
-            menu.insert(0, header_buttons)
+            menu = (tuple(header_buttons),) + menu
         if footer_buttons:
-            menu.append(footer_buttons)
+            menu = menu + (tuple(footer_buttons),)
         return menu
 
     def __finish(self, update: Update, message: str) -> int:
@@ -92,10 +114,9 @@ class XVCBot(object):
         :param message: Message to send.
         :return: State for conversation end.
         """
-        update.message.reply_text(message, reply_markup=ReplyKeyboardRemove())
+        update.message.reply_text(message, reply_markup=REMOVE_BUTTONS)
         return ConversationHandler.END
 
-    @AccessManager()
     def start(self, update: Update, _: CallbackContext) -> int:
         """
         Starts the conversation with the main menu.
@@ -105,7 +126,7 @@ class XVCBot(object):
         :return: State for main menu.
         """
         logging.info('Bot command: /start')
-        self.__status_thread = StatusThread(self.__vacuum)
+        self.__status_thread = StatusThread(self.__vacuum, self.__vacuum_lock)
         self.__status_thread.start()
         if isinstance(self.__vacuum, XVCHelperSimulator):
             update.message.reply_text('!!! Simulation !!!')
@@ -119,14 +140,16 @@ class XVCBot(object):
         :param update: Bot update.
         :return: True if connection could established.
         """
-        if self.__status_thread is not None:
-            if self.__status_thread.is_alive():
-                update.message.reply_text('Wait for status...', reply_markup=ReplyKeyboardRemove())
-                self.__status_thread.join()
+        # /start of another chat may replace the thread meanwhile
+        status_thread = self.__status_thread
+        if status_thread is not None:
+            if status_thread.is_alive():
+                update.message.reply_text('Wait for status...', reply_markup=REMOVE_BUTTONS)
+                status_thread.join()
 
-        if not self.__status_thread.success:
+        if not status_thread.success:
             self.__finish(update, 'Cannot establish connection to vacuum cleaner!')
-        return self.__status_thread.success
+        return status_thread.success
 
     def status(self, update: Update, _: CallbackContext) -> int:
         """
@@ -139,9 +162,10 @@ class XVCBot(object):
         if not self.__wait_for_status(update):
             return ConversationHandler.END
         logging.info('Bot command: status')
-        result, state = self.__vacuum.status()
+        with self.__vacuum_lock:
+            result, state = self.__vacuum.status()
         if result:
-            message = 'State: {}'.format(state)
+            message = f'State: {state}'
         else:
             message = 'Error'
         return self.__finish(update, message)
@@ -157,7 +181,9 @@ class XVCBot(object):
         if not self.__wait_for_status(update):
             return ConversationHandler.END
         logging.info('Bot command: home')
-        if self.__vacuum.home():
+        with self.__vacuum_lock:
+            succeeded = self.__vacuum.home()
+        if succeeded:
             message = 'Vacuum cleaner goes back to the dock...'
         else:
             message = 'Error'
@@ -188,7 +214,8 @@ class XVCBot(object):
         logging.info('Bot command: select zone')
         level = update.message.text
         if level != SKIP_BUTTON[0]:
-            self.__vacuum.set_fan_level(XVCHelperBase.FanLevel[level])
+            with self.__vacuum_lock:
+                self.__vacuum.set_fan_level(XVCHelperBase.FAN_LEVELS[level])
         update.message.reply_text('Select zone!', reply_markup=self.__zone_buttons)
         return SELECT_ZONE
 
@@ -202,8 +229,10 @@ class XVCBot(object):
         """
         logging.info('Bot command: cleaning')
         zone = update.message.text
-        if self.__vacuum.start_zone_cleaning(self.__zones[zone.upper()]):
-            message = 'Start cleaning {}...'.format(zone)
+        with self.__vacuum_lock:
+            succeeded = self.__vacuum.start_zone_cleaning(self.__zones[zone])
+        if succeeded:
+            message = f'Start cleaning {zone}...'
         else:
             message = 'Error'
         return self.__finish(update, message)
@@ -1,18 +1,28 @@
 import logging
+import time
 from abc import abstractmethod, ABCMeta
 from enum import Enum
+from operator import methodcaller
 from typing import List, Tuple
 
 from miio import Vacuum, DeviceException
 
 from xvc_util import XVCListable
 
+# constants
+GET_LIST = methodcaller('get_list')
+DISCOVER_ATTEMPTS = 3
+DISCOVER_DELAY = 0.1
+DISCOVER_BACKOFF = 4
+
 
 class XVCHelperBase(metaclass=ABCMeta):
     """
     Helper class to abstract and simplify vacuum methods.
     """
 
+    __slots__ = ()
+
     class FanLevel(Enum):
         """
         Enum for distinct fan levels.
@@ -23,7 +33,9 @@ class XVCHelperBase(metaclass=ABCMeta):
         Max = 100
         Mob = 105
 
-    RESPONSE_SUCCEEDED = ['ok']
+    FAN_LEVELS = {level.name: level for level in FanLevel}
+
+    RESPONSE_SUCCEEDED = ('ok',)
 
     @abstractmethod
     def status(self) -> Tuple[bool, str]:
@@ -79,6 +91,8 @@ class XVCHelperSimulator(XVCHelperBase):
     Helper class to abstract and simplify vacuum methods.
     """
 
+    __slots__ = ('__ip', '__token')
+
     def __init__(self, ip: str, token: str) -> None:
         """
         Initialize a object of class XVCHelper.
@@ -86,7 +100,7 @@ class XVCHelperSimulator(XVCHelperBase):
         :param ip: IP address of the vacuum cleaner.
         :param token: Token of the vacuum cleaner.
         """
-        logging.info('Simulation: {}:{}'.format(ip, token))
+        logging.info('Simulation: %s:%s', ip, token)
         self.__ip = ip
         self.__token = token
 
@@ -127,7 +141,7 @@ class XVCHelperSimulator(XVCHelperBase):
         """
         logging.info('Simulation: start_zone_cleaning()')
         for zone in zones:
-            logging.info('Simulation: {}'.format(zone))
+            logging.info('Simulation: %s', zone)
         return True
 
     def set_fan_level(self, fan_level: XVCHelperBase.FanLevel) -> bool:
@@ -146,6 +160,8 @@ class XVCHelper(XVCHelperBase):
     Helper class to abstract and simplify vacuum methods.
     """
 
+    __slots__ = ('__vacuum',)
+
     def __init__(self, ip: str, token: str) -> None:
         """
         Initialize a object of class XVCHelper.
@@ -156,15 +172,26 @@ class XVCHelper(XVCHelperBase):
         self.__vacuum = Vacuum(ip=ip, token=token, start_id=1)
 
         # check connection
-        for _ in range(3):
+        for attempt in range(DISCOVER_ATTEMPTS):
             try:
                 self.__vacuum.do_discover()
                 break
             except DeviceException:
-                continue
+                if attempt < DISCOVER_ATTEMPTS - 1:
+                    time.sleep(DISCOVER_DELAY * DISCOVER_BACKOFF ** attempt)
         else:
             raise ConnectionError('Cannot establish connection to Vacuum Cleaner at {}'.format(ip))
 
+    @staticmethod
+    def __is_succeeded(result: List) -> bool:
+        """
+        Checks the response of the vacuum cleaner.
+
+        :param result: Response of the vacuum cleaner.
+        :return: True if the response signals success, otherwise False.
+        """
+        return isinstance(result, list) and len(result) == 1 and result[0] == XVCHelperBase.RESPONSE_SUCCEEDED[0]
+
     def status(self) -> Tuple[bool, str]:
         """
         Gets current status.
@@ -187,7 +214,7 @@ class XVCHelper(XVCHelperBase):
         :return: True on success, otherwise False.
         """
         result = self.__vacuum.pause()
-        return result == XVCHelper.RESPONSE_SUCCEEDED
+        return XVCHelper.__is_succeeded(result)
 
     def home(self) -> bool:
         """
@@ -196,7 +223,7 @@ class XVCHelper(XVCHelperBase):
         :return: True on success, otherwise False.
         """
         result = self.__vacuum.home()
-        return result == XVCHelper.RESPONSE_SUCCEEDED
+        return XVCHelper.__is_succeeded(result)
 
     def start_zone_cleaning(self, zones: List[XVCListable]) -> bool:
         """
@@ -205,10 +232,10 @@ class XVCHelper(XVCHelperBase):
         :param zones: Different zones to clean.
         :return: True on success, otherwise False.
         """
+        zones_list = list(map(GET_LIST, zones))
         self.pause()
-        zones_list = [zone.get_list() for zone in zones]
         result = self.__vacuum.zoned_clean(zones_list)
-        return result == XVCHelper.RESPONSE_SUCCEEDED
+        return XVCHelper.__is_succeeded(result)
 
     def set_fan_level(self, fan_level: XVCHelperBase.FanLevel) -> bool:
         """
@@ -218,4 +245,4 @@ class XVCHelper(XVCHelperBase):
         :return: True on success, otherwise False.
         """
         result = self.__vacuum.set_fan_speed(fan_level.value)
-        return result == XVCHelper.RESPONSE_SUCCEEDED
+        return XVCHelper.__is_succeeded(result)